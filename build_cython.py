@@ -0,0 +1,16 @@
+# Optional: compile sample.py into a C extension to cut interpreter overhead on the
+# intent-parsing path. sample.py stays plain Python and runs unchanged without this step.
+#
+#   pip install cython
+#   python build_cython.py build_ext --inplace
+#   python -c "import sample; sample.main()"
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="sample",
+    ext_modules=cythonize(
+        "sample.py",
+        compiler_directives={"language_level": "3"},
+    ),
+)
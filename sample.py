@@ -1,110 +1,206 @@
 import sys
 import json
-import uuid
+import secrets
 import re
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTextEdit, QLineEdit, QPushButton, QLabel, QFrame, QScrollArea,
+    QPlainTextEdit, QLineEdit, QPushButton, QLabel, QFrame, QScrollArea,
     QSizePolicy, QProgressBar, QListWidget, QAbstractItemView, QStackedWidget
 )
 from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QFont, QColor, QPalette, QTextCursor, QTextCharFormat
 
 # --- SDK SCHEMA v1.1.1 ---
+# Flat module constants: hot paths read these directly instead of indexing nested dicts
+METRIC_MIN, METRIC_MAX = 0, 100
+MAX_DATA_ITEMS = 50
+MAX_LABEL_LEN = 32
+ID_FORMAT = r"node-[a-f0-9]{4}"
+
+# Plain namespace class (attributes stay mutable); read as TOKENS.success etc.
+class TOKENS:
+    primary = "#3B82F6"; success = "#10B981"; danger = "#EF4444"
+    surface = "#1E293B"; accent = "#F59E0B"
+
+# Name -> color map of TOKENS, built once and shared by the stylesheet, the elements and SDK_SCHEMA
+_TOKEN_COLORS = {name: value for name, value in vars(TOKENS).items() if not name.startswith("_")}
+
+# Nested view of the same schema, for code that reads it as data
 SDK_SCHEMA = {
     "constraints": {
-        "metric_range": (0, 100),
-        "max_data_items": 50,
-        "max_label_length": 32,
-        "id_format": r"node-[a-f0-9]{4}"
+        "metric_range": (METRIC_MIN, METRIC_MAX),
+        "max_data_items": MAX_DATA_ITEMS,
+        "max_label_length": MAX_LABEL_LEN,
+        "id_format": ID_FORMAT
     },
-    "tokens": {
-        "primary": "#3B82F6", "success": "#10B981", "danger": "#EF4444",
-        "surface": "#1E293B", "accent": "#F59E0B"
-    }
+    "tokens": _TOKEN_COLORS
 }
 
+# Hot-path caches: compiled patterns
+_ID_RE = re.compile(ID_FORMAT)
+# Id, quoted label and keyword label in one scan. Each alternative starts differently, so the
+# zero-width lookahead reports the leftmost match of every kind, exactly as separate searches would.
+_CMD_RE = re.compile(r"(?=(?P<id>(?i:%s))|['\"](?P<quoted>.*?)['\"]|(?i:called|named|item|for|to)\s+(?P<label>.*))" % ID_FORMAT)
+_VALUE_RE = re.compile(r"\b(\d+)\b")
+
+# Intent keyword groups (matched as substrings of the lowercased command)
+_EXPLICIT = frozenset(("toggle", "switch", "set node", "update node"))
+_APPEND_MARKERS = frozenset(("add item", "add to", "log", "append"))
+_TOGGLE = frozenset(("toggle", "switch"))
+_APPEND = frozenset(("append", "item", "put", "insert", "log", "add to"))
+_NUMERIC = frozenset(("update", "set", "push", "change"))
+_CREATE = frozenset(("add", "new", "create", "make"))
+_METRIC = frozenset(("progress", "bar", "percent"))
+_DATA = frozenset(("data", "list", "view", "logs"))
+_STATUS = frozenset(("status", "indicator", "light", "toggle"))
+_KEYWORDS = _EXPLICIT | _APPEND_MARKERS | _TOGGLE | _APPEND | _NUMERIC | _CREATE | _METRIC | _DATA | _STATUS | {"node-"}
+
+# Single pass: a zero-width, longest-first alternation reports the longest keyword at every
+# offset; _IMPLIED expands it to the keywords nested inside it ("add to" -> "add", "logs" -> "log").
+_INTENT_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, sorted(_KEYWORDS, key=len, reverse=True))))
+_IMPLIED = {k: frozenset(w for w in _KEYWORDS if w in k) for k in _KEYWORDS}
+
+def _scan_keywords(text):
+    return frozenset().union(*[_IMPLIED[k] for k in _INTENT_RE.findall(text)])
+
+@lru_cache(maxsize=128)
+def _parse_label_and_id(raw_text):
+    # Repeated commands (history recall, retries) skip the scan entirely
+    first = {}
+    for m in _CMD_RE.finditer(raw_text): first.setdefault(m.lastgroup, m.group(m.lastgroup))
+    target_id = first["id"].lower() if "id" in first else None
+    label = first.get("quoted") or ""
+    if not label:
+        label = first["label"].strip() if "label" in first else raw_text.split()[-1].capitalize()
+    if target_id: label = _ID_RE.sub("", label)  # no id anywhere means none left to strip
+    return target_id, label.strip()
+
+# One application-wide sheet: Qt parses it once and widgets pick rules by objectName/property
+_ELEMENT_BOX = "border-radius: 12px; padding: 10px; margin: 5px; border: 1px solid rgba(255,255,255,0.1);"
+GLOBAL_SHEET = "\n".join([
+    "NeuroShellOS, NeuroShellOS * { background-color: #020617; }",
+    *(f'BaseSemanticElement[color="{name}"] {{ background-color: {bg}; {_ELEMENT_BOX} }}' for name, bg in _TOKEN_COLORS.items()),
+    "QProgressBar#MetricBar { border-radius: 5px; background: rgba(0,0,0,0.2); text-align: center; color: white; }",
+    "QProgressBar#MetricBar::chunk { background-color: white; border-radius: 5px; }",
+    "QListWidget#DataList, QListWidget#DataList * { background: transparent; border: none; color: white; }",
+    "QLabel#StatusIndicator { background: rgba(0,0,0,0.3); border-radius: 4px; padding: 5px; font-weight: bold; }",
+    "QLabel#VersionBadge { background: #10B981; color: black; border-radius: 4px; padding: 2px 6px; font-size: 9px; font-weight: bold; }",
+    "QPushButton#HelpButton { background: #1E293B; color: #94A3B8; border: 1px solid #334155; padding: 8px; border-radius: 4px; }",
+    "QLabel#AboutHeader { font-size: 24px; font-weight: bold; color: #F59E0B; }",
+    "QLabel#AboutNotes { font-size: 14px; line-height: 160%; color: #CBD5E1; }",
+])
+
+def _font(px, bold=False):
+    font = QFont(); font.setPixelSize(px); font.setBold(bold)
+    return font
+
+def _palette(color):
+    # Text colors go through the palette: no CSS rule to parse or re-polish when they change
+    pal = QPalette()
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText): pal.setColor(role, color)
+    pal.setColor(QPalette.PlaceholderText, QColor(color.red(), color.green(), color.blue(), 128))
+    return pal
+
+def _restyle(widget, name, value):
+    # Property selectors only re-evaluate on re-polish, so skip it when nothing changed
+    if widget.property(name) != value:
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget); widget.style().polish(widget)
+
 class BaseSemanticElement(QFrame):
+    # No __slots__ here: shiboken wrappers always carry an instance __dict__, so slots save
+    # nothing, and subclassing a slotted QFrame subclass crashes PySide6 on attribute access.
+    CAPABILITIES = frozenset({"color_change"})
+    _HEADER_FONT, _META_FONT = _font(13, bold=True), _font(8)
+    _HEADER_PAL, _META_PAL = _palette(QColor("white")), _palette(QColor(255, 255, 255, 102))
+
     def __init__(self, eid, role, title):
         super().__init__()
         self.eid, self.role = eid, role
-        clean_title = title[:SDK_SCHEMA["constraints"]["max_label_length"]]
+        clean_title = title[:MAX_LABEL_LEN]
         self.state = {"title": clean_title, "color": "primary"}
-        self.capabilities = ["color_change"] 
         self.setMinimumHeight(120)
         self.layout = QVBoxLayout(self)
         self.header = QLabel(clean_title)
-        self.header.setStyleSheet("font-weight: bold; color: white; font-size: 13px;")
+        self.header.setFont(self._HEADER_FONT); self.header.setPalette(self._HEADER_PAL)
         self.layout.addWidget(self.header)
         self.meta = QLabel(f"{role.upper()} | {eid}")
-        self.meta.setStyleSheet("font-size: 8px; color: rgba(255,255,255,0.4);")
+        self.meta.setFont(self._META_FONT); self.meta.setPalette(self._META_PAL)
         self.layout.addWidget(self.meta)
+        self._pulse_anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._pulse_anim.setDuration(200); self._pulse_anim.setStartValue(0.6); self._pulse_anim.setEndValue(1.0)
         self.apply_base_style()
 
     def apply_base_style(self):
-        bg = SDK_SCHEMA["tokens"].get(self.state["color"], "#3B82F6")
-        self.setStyleSheet(f"BaseSemanticElement {{ background-color: {bg}; border-radius: 12px; padding: 10px; margin: 5px; border: 1px solid rgba(255,255,255,0.1); }}")
+        _restyle(self, "color", self.state["color"] if self.state["color"] in _TOKEN_COLORS else "primary")
 
     def pulse(self):
-        anim = QPropertyAnimation(self, b"windowOpacity", self)
-        anim.setDuration(200); anim.setStartValue(0.6); anim.setEndValue(1.0); anim.start()
+        # One animation per element, restarted on each pulse instead of allocating a new one
+        self._pulse_anim.stop(); self._pulse_anim.start()
 
 class MetricElement(BaseSemanticElement):
+    CAPABILITIES = BaseSemanticElement.CAPABILITIES | {"numeric_update"}
+
     def __init__(self, eid, role, title):
         super().__init__(eid, role, title)
-        self.capabilities.append("numeric_update")
         self.state["value"] = 0
         self.bar = QProgressBar()
-        self.bar.setRange(*SDK_SCHEMA["constraints"]["metric_range"])
-        self.bar.setStyleSheet("QProgressBar { border-radius: 5px; background: rgba(0,0,0,0.2); text-align: center; color: white; } QProgressBar::chunk { background-color: white; border-radius: 5px; }")
+        self.bar.setRange(METRIC_MIN, METRIC_MAX)
+        self.bar.setObjectName("MetricBar")
         self.layout.insertWidget(1, self.bar)
 
     def update_view(self, val):
-        min_v, max_v = SDK_SCHEMA["constraints"]["metric_range"]
-        clamped_val = max(min_v, min(max_v, int(val)))
+        clamped_val = max(METRIC_MIN, min(METRIC_MAX, int(val)))
+        if clamped_val == self.bar.value(): return  # bar already shows it: skip the repaint (a new bar sits at -1)
         self.state["value"] = clamped_val
         self.bar.setValue(clamped_val)
         self.header.setText(f"{self.state['title']} ({clamped_val}%)")
 
 class DataViewElement(BaseSemanticElement):
+    CAPABILITIES = BaseSemanticElement.CAPABILITIES | {"list_append"}
+
     def __init__(self, eid, role, title):
         super().__init__(eid, role, title)
-        self.capabilities.append("list_append")
-        self.state["items"] = []
+        self.state["items"] = deque(maxlen=MAX_DATA_ITEMS)
         self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet("background: transparent; border: none; color: white;")
+        self.list_widget.setObjectName("DataList")
         self.layout.insertWidget(1, self.list_widget)
 
     def update_view(self, new_item=None):
-        if new_item: self.state["items"].append(new_item)
-        limit = SDK_SCHEMA["constraints"]["max_data_items"]
-        if len(self.state["items"]) > limit: self.state["items"] = self.state["items"][-limit:]
-        self.list_widget.clear()
-        self.list_widget.addItems(self.state["items"])
+        if not new_item: return  # items only change through here, so nothing to refresh
+        self.state["items"].append(new_item)
+        self.list_widget.addItem(new_item)
+        # Only the delta touches Qt: append the new row, evict the oldest past the cap
+        while self.list_widget.count() > MAX_DATA_ITEMS: self.list_widget.takeItem(0)
         self.header.setText(f"{self.state['title']} [{len(self.state['items'])} items]")
 
 class StatusElement(BaseSemanticElement):
+    CAPABILITIES = BaseSemanticElement.CAPABILITIES | {"toggle_status"}
+    _ONLINE_PAL, _OFFLINE_PAL = _palette(QColor(TOKENS.success)), _palette(QColor(TOKENS.danger))
+
     def __init__(self, eid, role, title):
         super().__init__(eid, role, title)
-        self.capabilities.append("toggle_status")
         self.state["active"] = False
         self.indicator = QLabel("OFFLINE")
         self.indicator.setAlignment(Qt.AlignCenter)
-        self.indicator.setStyleSheet("background: rgba(0,0,0,0.3); border-radius: 4px; padding: 5px; font-weight: bold;")
+        self.indicator.setObjectName("StatusIndicator")
         self.layout.insertWidget(1, self.indicator)
 
     def update_view(self):
-        status = "ONLINE" if self.state["active"] else "OFFLINE"
-        color = SDK_SCHEMA["tokens"]["success"] if self.state["active"] else SDK_SCHEMA["tokens"]["danger"]
+        active = self.state["active"]
+        status = "ONLINE" if active else "OFFLINE"
+        if self.indicator.text() == status: return  # already showing this state
         self.indicator.setText(status)
-        self.indicator.setStyleSheet(f"background: rgba(0,0,0,0.3); border-radius: 4px; padding: 5px; font-weight: bold; color: {color};")
+        self.indicator.setPalette(self._ONLINE_PAL if active else self._OFFLINE_PAL)
 
 class NeuroShellOS(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("NeuroShellOS | SDK v1.1.1 Patch")
         self.resize(1100, 800)
-        self.setStyleSheet("background-color: #020617; color: #F8FAFC;")
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
@@ -127,18 +223,23 @@ class NeuroShellOS(QMainWindow):
         header_area = QHBoxLayout()
         header_label = QLabel("<b>SEMANTIC INTERPRETER</b>")
         badge = QLabel("v1.1.1")
-        badge.setStyleSheet("background: #10B981; color: black; border-radius: 4px; padding: 2px 6px; font-size: 9px; font-weight: bold;")
+        badge.setObjectName("VersionBadge")
         header_area.addWidget(header_label)
         header_area.addStretch()
         header_area.addWidget(badge)
         
-        self.log_display = QTextEdit(); self.log_display.setReadOnly(True)
+        self.log_display = QPlainTextEdit(); self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(500)
+        self._fmt_plain = QTextCharFormat()
+        self._fmt_bold = QTextCharFormat(); self._fmt_bold.setFontWeight(QFont.Bold)
+        self._fmt_colors = {}
+        for c in ("#10B981", "#EF4444", "#94A3B8"): self._log_format(c)
         self.input = QLineEdit(); self.input.setPlaceholderText("Command...")
-        self.input.returnPressed.connect(self.process_intent)
+        self.input.returnPressed.connect(self._maybe_process)
         
         self.help_btn = QPushButton("Developer Notes")
-        self.help_btn.setStyleSheet("background: #1E293B; color: #94A3B8; border: 1px solid #334155; padding: 8px; border-radius: 4px;")
-        self.help_btn.clicked.connect(lambda: self.stack.setCurrentIndex(1))
+        self.help_btn.setObjectName("HelpButton")
+        self.help_btn.clicked.connect(self._show_about)
 
         panel_layout.addLayout(header_area)
         panel_layout.addWidget(self.log_display)
@@ -146,99 +247,147 @@ class NeuroShellOS(QMainWindow):
         panel_layout.addWidget(self.help_btn)
         ws_layout.addWidget(panel)
 
-        self.about_page = QWidget(); self.stack.addWidget(self.about_page)
-        about_layout = QVBoxLayout(self.about_page); about_layout.setContentsMargins(50, 50, 50, 50)
-        dev_header = QLabel("v1.1.1 Pre-Alpha"); dev_header.setStyleSheet("font-size: 24px; font-weight: bold; color: #F59E0B;")
-        dev_notes = QLabel("<b>PROJECT STATUS:</b> Pre-Alpha / Concept Validation Prototype<br><br>"
-            "<b>PROOF OF CONCEPT:</b> This prototype is built to show that a <b>Semantic Metadata Layer</b> can replace traditional hard-coded GUIs. "
-            "It proves that interfaces can be dynamic, evolving based on the intent of the operator rather than static layouts.<br><br>"
-            "<b>THE HUMAN-AI BRIDGE:</b> Currently, the input is provided by humans to demonstrate functionality. In a real-world application, "
-            "<b>the input will be purely AI-driven</b>. An AI agent's raw reasoning will be intercepted and converted into these specific "
-            "SDK commands automatically. This environment serves as the visual playground for verifying that the underlying logic works.")
-        dev_notes.setWordWrap(True); dev_notes.setStyleSheet("font-size: 14px; line-height: 160%; color: #CBD5E1;")
-        back_btn = QPushButton("Return"); back_btn.setFixedWidth(200); back_btn.clicked.connect(lambda: self.stack.setCurrentIndex(0))
-        about_layout.addWidget(dev_header); about_layout.addSpacing(20); about_layout.addWidget(dev_notes); about_layout.addStretch(); about_layout.addWidget(back_btn)
+        self.about_page = None  # built on first visit, see _show_about
 
         self.registry = {}
+        self._intent_handlers = {
+            "CREATE_METRIC": partial(self._do_create, MetricElement, "metric_display"),
+            "CREATE_DATA": partial(self._do_create, DataViewElement, "data_view"),
+            "CREATE_STATUS": partial(self._do_create, StatusElement, "status_indicator"),
+            "CREATE_BASE": partial(self._do_create, BaseSemanticElement, "primary_action"),
+            "INTERACT_NUMERIC": self._do_numeric,
+            "INTERACT_TOGGLE": self._do_toggle,
+            "INTERACT_APPEND": self._do_append,
+        }
         self.sys_log("Kernel Online. Semantic Disambiguator Active.", "#10B981")
 
+    def _show_about(self, *_):
+        if self.about_page is None:
+            self.about_page = QWidget()
+            about_layout = QVBoxLayout(self.about_page); about_layout.setContentsMargins(50, 50, 50, 50)
+            dev_header = QLabel("v1.1.1 Pre-Alpha"); dev_header.setObjectName("AboutHeader")
+            dev_notes = QLabel("<b>PROJECT STATUS:</b> Pre-Alpha / Concept Validation Prototype<br><br>"
+                "<b>PROOF OF CONCEPT:</b> This prototype is built to show that a <b>Semantic Metadata Layer</b> can replace traditional hard-coded GUIs. "
+                "It proves that interfaces can be dynamic, evolving based on the intent of the operator rather than static layouts.<br><br>"
+                "<b>THE HUMAN-AI BRIDGE:</b> Currently, the input is provided by humans to demonstrate functionality. In a real-world application, "
+                "<b>the input will be purely AI-driven</b>. An AI agent's raw reasoning will be intercepted and converted into these specific "
+                "SDK commands automatically. This environment serves as the visual playground for verifying that the underlying logic works.")
+            dev_notes.setWordWrap(True); dev_notes.setObjectName("AboutNotes")
+            back_btn = QPushButton("Return"); back_btn.setFixedWidth(200); back_btn.clicked.connect(lambda: self.stack.setCurrentIndex(0))
+            about_layout.addWidget(dev_header); about_layout.addSpacing(20); about_layout.addWidget(dev_notes); about_layout.addStretch(); about_layout.addWidget(back_btn)
+            self.stack.addWidget(self.about_page)
+        self.stack.setCurrentWidget(self.about_page)
+
     def sys_log(self, msg, color="#94A3B8"):
-        self.log_display.append(f"<span style='color:{color};'>System: {msg}</span>")
+        self._append_log((f"System: {msg}", self._log_format(color)))
+
+    def _log_format(self, color):
+        fmt = self._fmt_colors.get(color)
+        if fmt is None:
+            fmt = self._fmt_colors[color] = QTextCharFormat(); fmt.setForeground(QColor(color))
+        return fmt
+
+    def _append_log(self, *runs):
+        # Formatted runs through a cursor: no HTML parsing, and the block cap bounds the document
+        bar = self.log_display.verticalScrollBar(); at_end = bar.value() == bar.maximum()
+        cursor = QTextCursor(self.log_display.document()); cursor.movePosition(QTextCursor.End)
+        if not self.log_display.document().isEmpty(): cursor.insertBlock()
+        for text, fmt in runs: cursor.insertText(text, fmt)
+        if at_end: bar.setValue(bar.maximum())
+
+    def _maybe_process(self, *_):
+        # Enter on an empty or blank line never reaches the parser; blank input is still cleared
+        text = self.input.text()
+        if text and not text.isspace(): self.process_intent()
+        elif text: self.input.clear()
 
     def process_intent(self):
         raw_text = self.input.text().strip()
         self.input.clear()
         if not raw_text: return
-        self.log_display.append(f"<b>Human:</b> {raw_text}")
+        self._append_log(("Human:", self._fmt_bold), (f" {raw_text}", self._fmt_plain))
         text = raw_text.lower()
 
-        target_id = None
-        id_match = re.search(SDK_SCHEMA["constraints"]["id_format"], text)
-        if id_match: target_id = id_match.group(0)
+        target_id, label = _parse_label_and_id(raw_text)
 
         # DISAMBIGUATION LOGIC
         intent = "unknown"
         
         # Detect Interaction Markers
-        is_explicit_interact = any(w in text for w in ["toggle", "switch", "set node", "update node"])
-        is_append_interact = ("add item" in text or "add to" in text or "log" in text or "append" in text)
+        hits = _scan_keywords(text)
+        is_explicit_interact = bool(hits & _EXPLICIT)
+        is_append_interact = bool(hits & _APPEND_MARKERS)
         
-        if target_id and (is_explicit_interact or is_append_interact or "node-" in text):
-            if any(w in text for w in ["toggle", "switch"]): intent = "INTERACT_TOGGLE"
-            elif any(w in text for w in ["append", "item", "put", "insert", "log", "add to"]): intent = "INTERACT_APPEND"
-            elif any(w in text for w in ["update", "set", "push", "change"]): intent = "INTERACT_NUMERIC"
+        if target_id and (is_explicit_interact or is_append_interact or "node-" in hits):
+            if hits & _TOGGLE: intent = "INTERACT_TOGGLE"
+            elif hits & _APPEND: intent = "INTERACT_APPEND"
+            elif hits & _NUMERIC: intent = "INTERACT_NUMERIC"
         
         # Detect Creation Markers (Only if not already flagged as interaction)
-        if intent == "unknown" and any(w in text for w in ["add", "new", "create", "make"]):
-            if any(w in text for w in ["progress", "bar", "percent"]): intent = "CREATE_METRIC"
-            elif any(w in text for w in ["data", "list", "view", "logs"]): intent = "CREATE_DATA"
-            elif any(w in text for w in ["status", "indicator", "light", "toggle"]): intent = "CREATE_STATUS"
+        if intent == "unknown" and hits & _CREATE:
+            if hits & _METRIC: intent = "CREATE_METRIC"
+            elif hits & _DATA: intent = "CREATE_DATA"
+            elif hits & _STATUS: intent = "CREATE_STATUS"
             else: intent = "CREATE_BASE"
 
-        quoted = re.findall(r"['\"](.*?)['\"]", raw_text)
-        label = quoted[0] if quoted else ""
-        if not label:
-            label_match = re.search(r"(?:called|named|item|for|to)\s+(.*)", raw_text, re.I)
-            label = label_match.group(1).strip() if label_match else raw_text.split()[-1].capitalize()
-        label = re.sub(SDK_SCHEMA["constraints"]["id_format"], "", label).strip()
-
         self.execute_intent(intent, target_id, label, text)
 
     def execute_intent(self, intent, tid, label, raw):
         if tid and tid not in self.registry:
             self.sys_log(f"Error: Node '{tid}' not found.", "#EF4444"); return
 
-        success, msg = False, ""
-        if intent.startswith("CREATE_"):
-            eid = f"node-{str(uuid.uuid4())[:4]}"
-            if intent == "CREATE_METRIC": el = MetricElement(eid, "metric_display", label)
-            elif intent == "CREATE_DATA": el = DataViewElement(eid, "data_view", label)
-            elif intent == "CREATE_STATUS": el = StatusElement(eid, "status_indicator", label)
-            else: el = BaseSemanticElement(eid, "primary_action", label)
-            self.canvas_layout.insertWidget(self.canvas_layout.count()-1, el)
-            self.registry[eid] = el; msg = f"Created {el.role} ({eid})"; success = True
-        elif intent == "INTERACT_NUMERIC":
-            target = self.registry[tid]
-            if "numeric_update" in target.capabilities:
-                val_match = re.search(r"\b(\d+)\b", raw.replace(tid, ""))
-                if val_match:
-                    target.update_view(int(val_match.group(1)))
-                    target.pulse(); msg = f"Set {tid} to {target.state['value']}%"; success = True
-            else: msg = f"Capability Error: {tid} is not a metric."
-        elif intent == "INTERACT_TOGGLE":
-            target = self.registry[tid]
-            if "toggle_status" in target.capabilities:
-                target.state["active"] = not target.state["active"]
-                target.update_view(); target.pulse(); msg = f"Toggled {tid}"; success = True
-        elif intent == "INTERACT_APPEND":
-            target = self.registry[tid]
-            if "list_append" in target.capabilities:
-                target.update_view(label); target.pulse(); msg = f"Logged data to {tid}"; success = True
-            else: msg = f"Capability Error: {tid} is not a data list."
-
+        handler = self._intent_handlers.get(intent)
+        success, msg = handler(tid, label, raw) if handler else (False, "")
         if success: self.sys_log(msg, "#10B981")
         else: self.sys_log(msg or "Interpreter: Semantic Mismatch.", "#EF4444")
 
+    @contextmanager
+    def _batched_canvas(self):
+        # Hold canvas repaints so the inserts inside share one layout/paint pass; re-entrant
+        if not self.canvas.updatesEnabled(): yield; return
+        self.canvas.setUpdatesEnabled(False)
+        try: yield
+        finally: self.canvas.setUpdatesEnabled(True); self.canvas.updateGeometry()
+
+    def create_many(self, specs):
+        # Batch entry point for agent-driven bursts: specs are (intent, label) pairs, e.g. ("CREATE_METRIC", "CPU").
+        # Only CREATE_* intents are accepted; anything else has no target here, so it is logged and skipped.
+        with self._batched_canvas():
+            for intent, label in specs:
+                if intent.startswith("CREATE_"): self.execute_intent(intent, None, label, label.lower())
+                else: self.sys_log(f"Error: create_many only accepts CREATE_* intents, got '{intent}'.", "#EF4444")
+
+    # Intent handlers: each takes (tid, label, raw) and returns (success, msg)
+    def _do_create(self, cls, role, tid, label, raw):
+        eid = f"node-{secrets.token_hex(2)}"
+        while eid in self.registry: eid = f"node-{secrets.token_hex(2)}"  # 16-bit ids can collide
+        el = cls(eid, role, label)
+        with self._batched_canvas(): self.canvas_layout.insertWidget(self.canvas_layout.count()-1, el)
+        self.registry[eid] = el
+        return True, f"Created {el.role} ({eid})"
+
+    def _do_numeric(self, tid, label, raw):
+        target = self.registry[tid]
+        if "numeric_update" not in target.CAPABILITIES: return False, f"Capability Error: {tid} is not a metric."
+        val_match = _VALUE_RE.search(raw.replace(tid, ""))
+        if not val_match: return False, ""
+        target.update_view(int(val_match.group(1)))
+        target.pulse(); return True, f"Set {tid} to {target.state['value']}%"
+
+    def _do_toggle(self, tid, label, raw):
+        target = self.registry[tid]
+        if "toggle_status" not in target.CAPABILITIES: return False, ""
+        target.state["active"] = not target.state["active"]
+        target.update_view(); target.pulse(); return True, f"Toggled {tid}"
+
+    def _do_append(self, tid, label, raw):
+        target = self.registry[tid]
+        if "list_append" not in target.CAPABILITIES: return False, f"Capability Error: {tid} is not a data list."
+        target.update_view(label); target.pulse(); return True, f"Logged data to {tid}"
+
+def main():
+    app = QApplication(sys.argv); app.setStyle("Fusion"); app.setStyleSheet(GLOBAL_SHEET); app.setPalette(_palette(QColor("#F8FAFC")))
+    win = NeuroShellOS(); win.show(); sys.exit(app.exec())
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv); app.setStyle("Fusion")
-    win = NeuroShellOS(); win.show(); sys.exit(app.exec())
\ No newline at end of file
+    main()